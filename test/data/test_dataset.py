@@ -10,6 +10,7 @@ from torch_frame.data import DataFrameToTensorFrameConverter, Dataset
 from torch_frame.data.dataset import canonicalize_col_to_pattern
 from torch_frame.data.stats import StatType
 from torch_frame.datasets import FakeDataset
+from torch_frame.testing import withCUDA
 from torch_frame.testing.image_embedder import RandomImageEmbedder
 from torch_frame.testing.text_embedder import HashTextEmbedder
 from torch_frame.typing import TaskType
@@ -32,6 +33,77 @@ def test_index_select():
     assert len(dataset[torch.tensor(5 * [True] + 5 * [False])]) == 5
 
 
+def test_index_select_view():
+    df = pd.DataFrame({'cat_1': np.arange(10), 'cat_2': np.arange(10)})
+    col_to_stype = {
+        'cat_1': torch_frame.categorical,
+        'cat_2': torch_frame.categorical
+    }
+    dataset = Dataset(df, col_to_stype, target_col='cat_2').materialize()
+
+    # Rows are only gathered once they are accessed:
+    view = dataset[2:8][[5, 0, -1]]
+    assert len(view) == 3
+    assert view._df is None and view._tensor_frame is None
+    assert view._view_root is dataset
+
+    assert view.df['cat_1'].tolist() == [7, 2, 7]
+    feat = view.tensor_frame.feat_dict[torch_frame.categorical].view(-1)
+    assert feat.tolist() == [7, 2, 7]
+    assert view.tensor_frame.y.tolist() == [7, 2, 7]
+
+    view = dataset[1::2][1:4]
+    assert view.df['cat_1'].tolist() == [3, 5, 7]
+    assert view.tensor_frame.y.tolist() == [3, 5, 7]
+
+    # Negative positions are resolved at view creation:
+    assert dataset[[-1, 0]]._view_index.tolist() == [9, 0]
+    assert dataset[2:8][[-1]]._view_index.tolist() == [7]
+
+    # Out-of-range positions are rejected at view creation:
+    for index in [[10], [-11], torch.tensor([0, 100])]:
+        with pytest.raises(IndexError, match="out of range"):
+            dataset[index]
+    with pytest.raises(IndexError, match="out of range"):
+        dataset[2:8][[6]]
+
+
+@pytest.mark.parametrize('max_rows', [0, 65536])
+def test_categorical_groups(max_rows, monkeypatch):
+    monkeypatch.setattr(torch_frame.data.dataset, 'CATEGORICAL_BATCH_MAX_ROWS',
+                        max_rows)
+    df = pd.DataFrame({
+        'a': ['x', 'y', 'x', None, 'x'],
+        'b': ['y', 'x', 'x', 'z', 'x'],
+        'c': [1, 2, 2, 1, 2],
+        'd': ['x', 'y', 'y', 'x', 'x'],
+        'e': [1, 2, 2, 2, 1],
+    })
+    col_to_stype = {col: torch_frame.categorical for col in df.columns}
+    dataset = Dataset(df, col_to_stype).materialize()
+
+    converter = dataset.convert_to_tensor_frame
+    groups = converter._categorical_groups(len(df), dataset._get_col_arrays())
+    assert groups == ([] if max_rows == 0 else [[0, 3], [2, 4]])
+
+    feat = dataset.tensor_frame.feat_dict[torch_frame.categorical]
+    for i, col in enumerate(df.columns):
+        expected = converter._get_mapper(col).forward(df[col])
+        assert torch.equal(feat[:, i].long(), expected)
+
+
+@withCUDA
+def test_materialize_device(device):
+    dataset = FakeDataset(num_rows=10).materialize()
+    expected = dataset.tensor_frame
+
+    tf = dataset.convert_to_tensor_frame(dataset.df, device)
+    assert tf.device == device
+    for stype, feat in expected.feat_dict.items():
+        assert torch.allclose(tf.feat_dict[stype].cpu(), feat, equal_nan=True)
+    assert torch.equal(tf.y.cpu(), expected.y)
+
+
 def test_shuffle():
     df = pd.DataFrame({'cat_1': np.arange(10), 'cat_2': np.arange(10)})
     col_to_stype = {
@@ -51,6 +123,23 @@ def test_col_select():
 
     assert dataset[['target']].feat_cols == []
 
+    cols = ['num_1', 'cat_1']
+    subset = dataset[cols]
+    assert cols == ['num_1', 'cat_1']
+    assert subset.feat_cols == ['num_1', 'cat_1']
+    assert len(dataset.feat_cols) > 2
+
+    # Mutating the returned list must not leak into the dataset or its subsets:
+    num_feat_cols = len(dataset.feat_cols)
+    dataset.feat_cols.append('target')
+    assert len(dataset.feat_cols) == num_feat_cols
+    assert len(dataset[cols].feat_cols) == len(cols)
+    assert subset.feat_cols == cols
+    assert list(subset.df.columns) == ['num_1', 'cat_1', 'target']
+    assert len(subset) == len(dataset)
+    assert np.shares_memory(subset.df['num_1'].to_numpy(),
+                            dataset.df['num_1'].to_numpy())
+
     with pytest.raises(RuntimeError, match="post materialization"):
         dataset.materialize()[['target']]
 
@@ -74,6 +163,49 @@ def test_categorical_target_order():
     assert torch.equal(dataset.tensor_frame.y, torch.tensor([0, 1, 1, 1]))
 
 
+def test_stats_cache(monkeypatch):
+    from torch_frame.data import _stats_cache
+
+    num_calls = 0
+    compute_col_stats = _stats_cache.compute_col_stats
+
+    def _compute_col_stats(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        return compute_col_stats(*args, **kwargs)
+
+    monkeypatch.setattr(_stats_cache, 'compute_col_stats', _compute_col_stats)
+    Dataset.clear_stats_cache()
+
+    df = pd.DataFrame({
+        'num': [1.0, 2.0, np.nan, 4.0],
+        'cat': [0, 1, 1, 2],
+        'text': ['a', 'b', 'a', None],
+    })
+    col_to_stype = {
+        'num': torch_frame.numerical,
+        'cat': torch_frame.categorical,
+        'text': torch_frame.categorical,
+    }
+    dataset1 = Dataset(df, col_to_stype).materialize()
+    assert num_calls == 3
+
+    # Only the numerical column is served from the cache:
+    dataset2 = Dataset(df.copy(), col_to_stype).materialize()
+    assert num_calls == 5
+    assert dataset1.col_stats == dataset2.col_stats
+
+    # Modified content does not hit the cache:
+    df.loc[0, 'num'] = 10.0
+    dataset3 = Dataset(df, col_to_stype).materialize()
+    assert num_calls == 8
+    assert dataset3.col_stats['num'][StatType.QUANTILES][-1] == 10.0
+
+    Dataset.clear_stats_cache()
+    Dataset(df, col_to_stype).materialize()
+    assert num_calls == 11
+
+
 def test_dataset_inductive_transform():
     dataset = FakeDataset(num_rows=10).materialize()
 
@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
+import pytest
 import torch
 
+import torch_frame
 from torch_frame.data.mapper import (
     CategoricalTensorMapper,
     EmbeddingTensorMapper,
@@ -28,6 +30,17 @@ def test_numerical_tensor_mapper():
     out = mapper.backward(out)
     pd.testing.assert_series_equal(out, ser, check_dtype=False)
 
+    feat = torch.zeros(4, 2)
+    out = mapper.forward(ser, out=feat[:, 1])
+    assert out.data_ptr() == feat[:, 1].data_ptr()
+    assert torch.equal(feat[:, 0], torch.zeros(4))
+    assert torch.equal(feat[:, 1].nan_to_num(), expected.nan_to_num())
+
+    # Values of the default dtype are shared without copying:
+    values = ser.to_numpy(dtype=np.float32)
+    out = mapper.forward(ser, values=values)
+    assert out.data_ptr() == values.ctypes.data
+
 
 def test_categorical_tensor_mapper():
     ser = pd.Series(['A', 'B', None, 'C', 'B'])
@@ -42,6 +55,55 @@ def test_categorical_tensor_mapper():
     out = mapper.backward(out)
     pd.testing.assert_series_equal(out, pd.Series(['A', 'B', None, None, 'B']))
 
+    feat = torch.zeros(5, 2, dtype=torch.long)
+    mapper.forward(ser, out=feat[:, 0])
+    assert torch.equal(feat[:, 0], expected)
+
+    out = mapper.forward(ser, dtype=torch.int8)
+    assert out.dtype == torch.int8
+    assert torch.equal(out, expected.to(torch.int8))
+
+    # Categorical dtype with and without matching categories:
+    for categories in [['B', 'A'], ['A', 'B', 'C']]:
+        out = mapper.forward(ser.astype(pd.CategoricalDtype(categories)))
+        assert out.dtype == torch.long
+        assert torch.equal(out, expected)
+
+
+def test_categorical_tensor_mapper_index_dtype():
+    assert CategoricalTensorMapper.index_dtype(2) == torch.int8
+    assert CategoricalTensorMapper.index_dtype(127) == torch.int8
+    assert CategoricalTensorMapper.index_dtype(128) == torch.int16
+    assert CategoricalTensorMapper.index_dtype(40000) == torch.int32
+    assert CategoricalTensorMapper.index_dtype(2**31) == torch.long
+
+
+@pytest.mark.parametrize('with_lut', [False, True])
+def test_numerical_categorical_tensor_mapper(with_lut, monkeypatch):
+    if not with_lut:
+        monkeypatch.setattr(torch_frame.data.mapper, 'LUT_MAX_CATEGORY', 0)
+
+    ser = pd.Series([1.0, 3.0, float('NaN'), 2.0, 5.0, 1.0])
+    expected = torch.tensor([1, 0, -1, 2, -1, 1])
+
+    mapper = CategoricalTensorMapper([3, 1, 2])
+    out = mapper.forward(ser)
+    assert out.dtype == torch.long
+    assert torch.equal(out, expected)
+
+    assert (mapper._lut is not None) == with_lut
+
+    out = mapper.forward(pd.Series([2, 1, 4, -1]))
+    assert torch.equal(out, torch.tensor([2, 1, -1, -1]))
+
+    out = mapper.forward(pd.Series([2.0, 1.5, 3.0]))
+    assert torch.equal(out, torch.tensor([2, -1, 0]))
+
+    # Several columns sharing the same categories:
+    values = np.stack([ser.to_numpy(), ser.to_numpy()[::-1]])
+    out = mapper.forward(ser, values=values)
+    assert torch.equal(out, torch.stack([expected, expected.flip(0)]))
+
 
 def test_timestamp_tensor_mapper():
     format = '%Y-%m-%d %H:%M:%S'
@@ -60,6 +122,11 @@ def test_timestamp_tensor_mapper():
         torch.tensor([2020, 2, 8, 0, 17, 20, 4]).view(1, -1))
     assert out.dtype == torch.long
 
+    feat = torch.zeros(2, 3, 7, dtype=torch.long)
+    mapper.forward(ser, out=feat[:, 1])
+    assert torch.equal(feat[:, 1], out)
+    assert torch.all(feat[:, 0] == 0) and torch.all(feat[:, 2] == 0)
+
 
 def test_multicategorical_tensor_mapper():
     for ser in [
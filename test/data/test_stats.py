@@ -26,6 +26,19 @@ def test_compute_col_stats_numerical():
     }
 
 
+def test_compute_col_stats_numerical_with_values():
+    ser = pd.Series([1, 2, 3, np.nan], dtype='Int64')
+    stype = numerical
+    values = np.array([1.0, 2.0, 3.0, np.nan])
+    expected = {
+        StatType.MEAN: 2.0,
+        StatType.STD: 0.816496580927726,
+        StatType.QUANTILES: [1.0, 1.5, 2.0, 2.5, 3.0],
+    }
+    assert compute_col_stats(ser, stype) == expected
+    assert compute_col_stats(ser, stype, values=values) == expected
+
+
 def test_compute_col_stats_numerical_with_dirty_columns():
     ser = pd.Series([1, 2, 3, 'One', np.inf, np.nan])
     stype = numerical
@@ -41,6 +54,14 @@ def test_compute_col_stats_categorical():
         StatType.COUNT: (['a', 'b', 'c'], [3, 1, 1]),
     }
 
+    ser = pd.Series(['c', 'a', None, 'a', 'b', 'a'], dtype='category')
+    assert compute_col_stats(ser, stype) == {
+        StatType.COUNT: (['a', 'b', 'c'], [3, 1, 1]),
+    }
+
+    ser = pd.Series([None, None], dtype=pd.CategoricalDtype(['a']))
+    assert compute_col_stats(ser, stype) == {StatType.COUNT: ([], [])}
+
 
 def test_compute_col_stats_multi_categorical():
     for ser, sep in [
@@ -97,7 +97,7 @@ def test_fake_dataset(with_nan, tokenize_with_batch, text_batch_size,
         assert (~torch.isnan(feat_num)).all()
 
     feat_cat = tensor_frame.feat_dict[torch_frame.categorical]
-    assert feat_cat.dtype == torch.long
+    assert feat_cat.dtype == torch.int8
     assert feat_cat.size() == (num_rows, 2)
     if with_nan:
         assert (feat_cat == -1).any()
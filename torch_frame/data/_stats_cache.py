@@ -0,0 +1,89 @@
+r"""A process-wide LRU cache of numerical column statistics, keyed by a hash
+of the column content, such that materializing datasets that share columns
+only computes their statistics once.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+import torch_frame
+from torch_frame.data.stats import StatType, compute_col_stats
+from torch_frame.typing import Series
+
+MAX_CACHE_SIZE = 1024
+
+_cache: OrderedDict[tuple, dict[StatType, Any]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _fingerprint(values: np.ndarray) -> str:
+    values = np.ascontiguousarray(values)
+    return hashlib.blake2b(values.data, digest_size=16).hexdigest()
+
+
+def cached_compute_col_stats(
+    ser: Series,
+    stype: torch_frame.stype,
+    sep: str | None = None,
+    time_format: str | None = None,
+    values: np.ndarray | None = None,
+) -> dict[StatType, Any]:
+    r"""Computes the statistics of a column via :meth:`compute_col_stats`,
+    re-using previously computed statistics of a numerical column with
+    identical content.
+
+    Args:
+        ser (Series): The column.
+        stype (torch_frame.stype): The semantic type of the column.
+        sep (str, optional): The separator of a multi-categorical column.
+            (default: :obj:`None`)
+        time_format (str, optional): The format of a timestamp column.
+            (default: :obj:`None`)
+        values (np.ndarray, optional): The NumPy representation of
+            :obj:`ser`. Only numerical columns with a given,
+            non-:obj:`object` array are cached. (default: :obj:`None`)
+    """
+    def compute() -> dict[StatType, Any]:
+        # Only numerical statistics make use of the NumPy representation:
+        return compute_col_stats(
+            ser,
+            stype,
+            sep,
+            time_format,
+            values=values if stype == torch_frame.numerical else None,
+        )
+
+    if (stype != torch_frame.numerical or values is None
+            or values.dtype.hasobject):
+        return compute()
+
+    key = (
+        _fingerprint(values),
+        values.dtype.str,
+        values.shape,
+    )
+    with _lock:
+        stats = _cache.get(key)
+        if stats is not None:
+            _cache.move_to_end(key)
+            return copy.deepcopy(stats)
+
+    stats = compute()
+
+    with _lock:
+        _cache[key] = copy.deepcopy(stats)
+        if len(_cache) > MAX_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return stats
+
+
+def clear_stats_cache() -> None:
+    r"""Clears the cache of column statistics."""
+    with _lock:
+        _cache.clear()
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import copy
 import functools
+import os
 import os.path as osp
 from abc import ABC
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pandas.api.types as ptypes
 import torch
 from torch import Tensor
 
@@ -18,6 +22,10 @@ from torch_frame.config import (
     TextTokenizerConfig,
 )
 from torch_frame.data import TensorFrame
+from torch_frame.data._stats_cache import (
+    cached_compute_col_stats,
+    clear_stats_cache,
+)
 from torch_frame.data.mapper import (
     CategoricalTensorMapper,
     EmbeddingTensorMapper,
@@ -30,11 +38,12 @@ from torch_frame.data.mapper import (
 )
 from torch_frame.data.multi_embedding_tensor import MultiEmbeddingTensor
 from torch_frame.data.multi_nested_tensor import MultiNestedTensor
-from torch_frame.data.stats import StatType, compute_col_stats
+from torch_frame.data.stats import StatType
 from torch_frame.typing import (
     ColumnSelectType,
     DataFrame,
     IndexSelectType,
+    Series,
     TaskType,
     TensorData,
 )
@@ -64,6 +73,25 @@ COL_TO_PATTERN_ALLOW_NONE_MAPPING = {
     "col_to_image_embedder_cfg": False,
 }
 
+# Semantic types whose tensor mappers solely rely on pandas/NumPy/PyTorch
+# kernels (which release the GIL) and can therefore be mapped column-wise in a
+# thread pool. Semantic types that invoke user-defined embedders or tokenizers
+# are always mapped sequentially.
+PARALLEL_STYPES = {
+    torch_frame.numerical,
+    torch_frame.categorical,
+    torch_frame.multicategorical,
+    torch_frame.sequence_numerical,
+    torch_frame.timestamp,
+    torch_frame.embedding,
+}
+
+# The maximum number of rows up to which categorical columns sharing the same
+# categories get mapped together rather than column-wise. For larger frames,
+# the per-call overhead is negligible and mapping column-wise in parallel
+# is faster.
+CATEGORICAL_BATCH_MAX_ROWS = 65536
+
 
 def requires_pre_materialization(func):
     @functools.wraps(func)
@@ -286,39 +314,211 @@ class DataFrameToTensorFrameConverter:
                 tf.col_names_dict.pop(stype)
         return tf
 
+    def _forward(
+        self,
+        col: str,
+        ser: Series,
+        device: torch.device | None = None,
+        col_to_values: dict[str, np.ndarray] | None = None,
+        **kwargs,
+    ) -> TensorData:
+        r"""Maps a single column via its :class:`TensorMapper`."""
+        if col_to_values is not None and col in col_to_values:
+            kwargs['values'] = col_to_values[col]
+        return self._get_mapper(col).forward(ser, device=device, **kwargs)
+
+    def _empty_feat(
+        self,
+        stype: torch_frame.stype,
+        num_rows: int,
+    ) -> Tensor | None:
+        r"""Allocates the feature tensor of :obj:`stype` upfront, in case its
+        :class:`TensorMapper` can write columns into it directly.
+        """
+        col_names = self.col_names_dict[stype]
+        if stype == torch_frame.numerical:
+            dtype = torch.get_default_dtype()
+        elif stype == torch_frame.categorical:
+            # Use the narrowest integer type that holds all category indices:
+            num_categories = max(
+                len(self.col_stats[col][StatType.COUNT][0])
+                for col in col_names)
+            dtype = CategoricalTensorMapper.index_dtype(num_categories)
+        elif stype == torch_frame.timestamp:
+            return torch.empty(
+                (num_rows, len(col_names),
+                 len(TimestampTensorMapper.TIME_TO_INDEX)),
+                dtype=torch.long,
+            )
+        else:
+            return None
+        return torch.empty((num_rows, len(col_names)), dtype=dtype)
+
+    def _categorical_groups(
+        self,
+        num_rows: int,
+        col_to_values: dict[str, np.ndarray] | None,
+    ) -> list[list[int]]:
+        r"""Returns groups of (at least two) categorical feature columns that
+        share the same categories and the same NumPy value type, such that
+        each group can be mapped via a single :class:`TensorMapper` call.
+        """
+        if col_to_values is None or num_rows > CATEGORICAL_BATCH_MAX_ROWS:
+            return []
+        groups: dict[tuple, list[int]] = defaultdict(list)
+        col_names = self.col_names_dict.get(torch_frame.categorical, [])
+        for i, col in enumerate(col_names):
+            if col not in col_to_values:
+                continue
+            categories = self.col_stats[col][StatType.COUNT][0]
+            key = (tuple(categories), col_to_values[col].dtype.str)
+            groups[key].append(i)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def _forward_categorical_group(
+        self,
+        group: list[int],
+        df: DataFrame,
+        col_to_values: dict[str, np.ndarray],
+        out: Tensor,
+    ):
+        r"""Maps a group of categorical columns sharing the same categories
+        at once and writes them into the columns :obj:`group` of :obj:`out`.
+        """
+        col_names = [
+            self.col_names_dict[torch_frame.categorical][i] for i in group
+        ]
+        values = np.stack([col_to_values[col] for col in col_names])
+        codes = torch.empty(values.shape, dtype=out.dtype)
+        self._get_mapper(col_names[0]).forward(df[col_names[0]], values=values,
+                                               out=codes)
+        out[:, group] = codes.t()
+
+    @staticmethod
+    def _to_device_async(
+        feat: Tensor,
+        device: torch.device,
+        stream: torch.cuda.Stream,
+    ) -> Tensor:
+        r"""Enqueues the transfer of :obj:`feat` to :obj:`device` via
+        page-locked memory on :obj:`stream`. The caller needs to synchronize
+        :obj:`stream` before accessing the result.
+        """
+        with torch.cuda.stream(stream):
+            out = feat.pin_memory().to(device, non_blocking=True)
+        # The result will be consumed on the current stream:
+        out.record_stream(torch.cuda.current_stream(device))
+        return out
+
     def __call__(
         self,
         df: DataFrame,
         device: torch.device | None = None,
+        col_to_values: dict[str, np.ndarray] | None = None,
     ) -> TensorFrame:
         r"""Convert a given :class:`DataFrame` object into :class:`TensorFrame`
         object.
+
+        Args:
+            df (DataFrame): The data frame to convert.
+            device (torch.device, optional): Device to load the
+                :class:`TensorFrame` object. (default: :obj:`None`)
+            col_to_values (Dict[str, np.ndarray], optional): A dictionary
+                holding pre-computed NumPy representations of numerical and
+                categorical columns in :obj:`df`, *e.g.*, as already computed
+                for column statistics. (default: :obj:`None`)
         """
         xs_dict: dict[torch_frame.stype, list[TensorData]] = defaultdict(list)
 
-        for stype, col_names in self.col_names_dict.items():
-            for col in col_names:
-                out = self._get_mapper(col).forward(df[col], device=device)
-                xs_dict[stype].append(out)
+        # Numerical, categorical and timestamp columns are written into a
+        # pre-allocated feature tensor directly. Only the columns of
+        # multi-tensor semantic types are collected and concatenated:
+        out_dict: dict[torch_frame.stype, Tensor] = {}
+        for stype in self.col_names_dict.keys():
+            out = self._empty_feat(stype, len(df))
+            if out is not None:
+                out_dict[stype] = out
+
+        # On CUDA, pre-allocated features are transferred on a side stream as
+        # soon as all of their columns are mapped, which overlaps the transfer
+        # with mapping the remaining columns:
+        stream: torch.cuda.Stream | None = None
+        if device is not None and torch.device(device).type == 'cuda':
+            stream = torch.cuda.Stream(device)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # Map columns of `PARALLEL_STYPES` in a thread pool on CPU. They
+            # get moved to `device` at once after all columns are mapped:
+            futures = {}
+
+            # Short categorical columns sharing the same categories are
+            # mapped together to amortize the per-call overhead of mapping:
+            if torch_frame.categorical in out_dict:
+                col_names = self.col_names_dict[torch_frame.categorical]
+                for group in self._categorical_groups(len(df), col_to_values):
+                    future = executor.submit(
+                        self._forward_categorical_group,
+                        group,
+                        df,
+                        col_to_values,
+                        out_dict[torch_frame.categorical],
+                    )
+                    for i in group:
+                        futures[col_names[i]] = future
+
+            for stype, col_names in self.col_names_dict.items():
+                if stype not in PARALLEL_STYPES:
+                    continue
+                for i, col in enumerate(col_names):
+                    if col in futures:
+                        continue
+                    kwargs = {}
+                    if stype in out_dict:
+                        kwargs['out'] = out_dict[stype][:, i]
+                    futures[col] = executor.submit(
+                        self._forward,
+                        col,
+                        df[col],
+                        col_to_values=col_to_values,
+                        **kwargs,
+                    )
+            for stype, col_names in self.col_names_dict.items():
+                for col in col_names:
+                    if col in futures:
+                        out = futures[col].result()
+                    else:
+                        out = self._forward(col, df[col], device)
+                    if stype not in out_dict:
+                        xs_dict[stype].append(out)
+                if stype in out_dict and stream is not None:
+                    out_dict[stype] = self._to_device_async(
+                        out_dict[stype], device, stream)
 
         feat_dict = {}
-        for stype, xs in xs_dict.items():
-            if stype.use_multi_nested_tensor:
+        for stype in self.col_names_dict.keys():
+            xs = xs_dict[stype]
+            if stype in out_dict:
+                feat_dict[stype] = out_dict[stype]
+            elif stype.use_multi_nested_tensor:
                 feat_dict[stype] = MultiNestedTensor.cat(xs, dim=1)
             elif stype.use_dict_multi_nested_tensor:
                 feat_dict[stype]: dict[str, MultiNestedTensor] = {}
                 for key in xs[0].keys():
                     feat_dict[stype][key] = MultiNestedTensor.cat(
                         [x[key] for x in xs], dim=1)
-            elif stype.use_multi_embedding_tensor:
-                feat_dict[stype] = MultiEmbeddingTensor.cat(xs, dim=1)
             else:
-                feat_dict[stype] = torch.stack(xs, dim=1)
+                assert stype.use_multi_embedding_tensor
+                feat_dict[stype] = MultiEmbeddingTensor.cat(xs, dim=1)
+            if stype in PARALLEL_STYPES:
+                feat_dict[stype] = feat_dict[stype].to(device)
 
         y: Tensor | None = None
         if self.target_col is not None and self.target_col in df:
-            y = self._get_mapper(self.target_col).forward(
-                df[self.target_col], device=device)
+            y = self._forward(self.target_col, df[self.target_col], device,
+                              col_to_values)
+
+        if stream is not None:
+            stream.synchronize()
 
         tf = TensorFrame(feat_dict, self.col_names_dict, y)
         return self._merge_feat(tf)
@@ -432,6 +632,10 @@ class Dataset(ABC):
         self._is_materialized: bool = False
         self._col_stats: dict[str, dict[StatType, Any]] = {}
         self._tensor_frame: TensorFrame | None = None
+        # Datasets created via `index_select` are views of a root dataset,
+        # whose rows are only gathered once `df` or `tensor_frame` is read:
+        self._view_root: Dataset | None = None
+        self._view_index: slice | np.ndarray | None = None
 
     def canonicalize_and_validate_col_to_pattern(
         self,
@@ -496,6 +700,10 @@ class Dataset(ABC):
         return f"{self.__class__.__name__}()"
 
     def __len__(self) -> int:
+        if self._view_root is not None and self._df is None:
+            if isinstance(self._view_index, slice):
+                return len(range(len(self._view_root))[self._view_index])
+            return len(self._view_index)
         return len(self.df)
 
     def __getitem__(self, index: IndexSelectType) -> Dataset:
@@ -508,13 +716,15 @@ class Dataset(ABC):
 
         return self.index_select(index)
 
+    @functools.cached_property
+    def _feat_cols(self) -> tuple[str, ...]:
+        return tuple(col for col in self.col_to_stype.keys()
+                     if col != self.target_col)
+
     @property
     def feat_cols(self) -> list[str]:
         r"""The input feature columns of the dataset."""
-        cols = list(self.col_to_stype.keys())
-        if self.target_col is not None:
-            cols.remove(self.target_col)
-        return cols
+        return list(self._feat_cols)
 
     @property
     def task_type(self) -> TaskType:
@@ -533,7 +743,18 @@ class Dataset(ABC):
     @property
     def num_rows(self):
         r"""The number of rows of the dataset."""
-        return len(self.df)
+        return len(self)
+
+    @property
+    def df(self) -> DataFrame:
+        r"""The underlying data frame of the dataset."""
+        if self._df is None and self._view_root is not None:
+            self._df = self._view_root.df.iloc[self._view_index]
+        return self._df
+
+    @df.setter
+    def df(self, df: DataFrame):
+        self._df = df
 
     @property
     @requires_post_materialization
@@ -580,7 +801,7 @@ class Dataset(ABC):
             # Materialized without specifying path at first and materialize
             # again by specifying the path
             if path is not None and not osp.isfile(path):
-                torch_frame.save(self._tensor_frame, self._col_stats, path)
+                torch_frame.save(self.tensor_frame, self._col_stats, path)
             return self
 
         if path is not None and osp.isfile(path):
@@ -593,25 +814,38 @@ class Dataset(ABC):
             self._is_materialized = True
             return self
 
+        # Convert columns into NumPy arrays only once, and share them across
+        # column statistics and `TensorFrame` creation:
+        col_arrays = self._get_col_arrays()
+
         # 1. Fill column statistics:
         if col_stats is None:
-            # calculate from data if col_stats is not provided
+            # calculate from data if col_stats is not provided, each column
+            # independently in a thread pool
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    col:
+                    executor.submit(
+                        cached_compute_col_stats,
+                        self.df[col],
+                        stype,
+                        sep=self.col_to_sep.get(col, None),
+                        time_format=self.col_to_time_format.get(col, None),
+                        values=col_arrays.get(col, None),
+                    )
+                    for col, stype in self.col_to_stype.items()
+                }
             for col, stype in self.col_to_stype.items():
-                ser = self.df[col]
-                self._col_stats[col] = compute_col_stats(
-                    ser,
-                    stype,
-                    sep=self.col_to_sep.get(col, None),
-                    time_format=self.col_to_time_format.get(col, None),
-                )
+                self._col_stats[col] = futures[col].result()
                 # For a target column, sort categories lexicographically
                 # such that we do not accidentally swap labels in binary
                 # classification tasks.
                 if col == self.target_col and stype == torch_frame.categorical:
                     index, value = self._col_stats[col][StatType.COUNT]
                     if len(index) == 2:
-                        ser = pd.Series(index=index, data=value).sort_index()
-                        index, value = ser.index.tolist(), ser.values.tolist()
+                        pairs = sorted(zip(index, value))
+                        index = [pair[0] for pair in pairs]
+                        value = [pair[1] for pair in pairs]
                         self._col_stats[col][StatType.COUNT] = (index, value)
         else:
             # basic validation for the col_stats provided by the user
@@ -628,7 +862,8 @@ class Dataset(ABC):
 
         # 2. Create the `TensorFrame`:
         self._to_tensor_frame_converter = self._get_tensorframe_converter()
-        self._tensor_frame = self._to_tensor_frame_converter(self.df, device)
+        self._tensor_frame = self._to_tensor_frame_converter(
+            self.df, device, col_arrays)
 
         # 3. Update col stats based on `TensorFrame`
         self._update_col_stats()
@@ -642,6 +877,30 @@ class Dataset(ABC):
 
         return self
 
+    @staticmethod
+    def clear_stats_cache() -> None:
+        r"""Clears the process-wide cache of column statistics. Statistics of
+        numerical columns are cached by column content during
+        :meth:`materialize`, such that datasets sharing the same columns only
+        compute them once.
+        """
+        clear_stats_cache()
+
+    def _get_col_arrays(self) -> dict[str, np.ndarray]:
+        r"""Returns the NumPy arrays of numerical and categorical columns in
+        :obj:`df`, which are shared across column statistics and tensor
+        mapping during materialization.
+        """
+        col_arrays: dict[str, np.ndarray] = {}
+        for col, stype in self.col_to_stype.items():
+            ser = self.df[col]
+            if stype == torch_frame.numerical and ptypes.is_numeric_dtype(ser):
+                col_arrays[col] = NumericalTensorMapper.to_numpy(ser)
+            elif (stype == torch_frame.categorical
+                  and not isinstance(ser.dtype, pd.CategoricalDtype)):
+                col_arrays[col] = ser.to_numpy()
+        return col_arrays
+
     def _get_tensorframe_converter(self) -> DataFrameToTensorFrameConverter:
         return DataFrameToTensorFrameConverter(
             col_to_stype=self.col_to_stype,
@@ -675,6 +934,14 @@ class Dataset(ABC):
     @requires_post_materialization
     def tensor_frame(self) -> TensorFrame:
         r"""Returns the :class:`TensorFrame` of the dataset."""
+        if self._tensor_frame is None and self._view_root is not None:
+            tf = self._view_root._tensor_frame
+            index = self._view_index
+            if isinstance(index, np.ndarray):
+                # Transfer row positions to the device once, rather than
+                # implicitly for every feature:
+                index = torch.from_numpy(index).to(tf.device)
+            self._tensor_frame = tf[index]
         return self._tensor_frame
 
     @property
@@ -702,15 +969,59 @@ class Dataset(ABC):
                 stop = round(stop * len(self))
             index = slice(start, stop, step)
 
-        dataset = copy.copy(self)
-
-        iloc = index.cpu().numpy() if isinstance(index, Tensor) else index
-        dataset.df = self.df.iloc[iloc]
+        # Only record the selected row positions relative to the root dataset
+        # (which is kept alive by the view) and defer gathering the rows of
+        # both `df` and `tensor_frame` until they are actually accessed:
+        if isinstance(index, slice):
+            index = self._compose_view_index(slice(None), index, len(self))
+        else:
+            if isinstance(index, Tensor):
+                index = index.cpu().numpy()
+            index = np.asarray(index)
+            if index.dtype == np.bool_:
+                index = np.flatnonzero(index)
+            index = index.astype(np.int64, copy=False).reshape(-1)
+            # Validate row positions eagerly, since rows are only gathered
+            # lazily, and make negative positions non-negative:
+            num_rows = len(self)
+            if index.size > 0 and (index.min() < -num_rows
+                                   or index.max() >= num_rows):
+                raise IndexError(f"Index out of range for a dataset with "
+                                 f"{num_rows} rows")
+            if index.size > 0 and index.min() < 0:
+                index = np.where(index < 0, index + num_rows, index)
+
+        root = self if self._view_root is None else self._view_root
+        if self._view_root is not None:
+            index = self._compose_view_index(self._view_index, index,
+                                             len(root))
 
-        dataset._tensor_frame = self._tensor_frame[index]
+        dataset = copy.copy(self)
+        dataset._view_root = root
+        dataset._view_index = index
+        dataset._df = None
+        dataset._tensor_frame = None
 
         return dataset
 
+    @staticmethod
+    def _compose_view_index(
+        outer: slice | np.ndarray,
+        inner: slice | np.ndarray,
+        num_rows: int,
+    ) -> slice | np.ndarray:
+        r"""Composes the row positions :obj:`inner` of a view with the row
+        positions :obj:`outer` of its parent view, such that the result
+        directly indexes a root dataset holding :obj:`num_rows` rows.
+        """
+        if isinstance(outer, slice) and isinstance(inner, slice):
+            rows = range(num_rows)[outer][inner]
+            stop = rows.stop if rows.stop >= 0 else None
+            return slice(rows.start, stop, rows.step)
+        if isinstance(outer, slice):
+            outer = np.arange(*outer.indices(num_rows), dtype=np.int64)
+        return outer[inner]
+
     def shuffle(
         self,
         return_perm: bool = False,
@@ -725,14 +1036,23 @@ class Dataset(ABC):
         r"""Returns a subset of the dataset from specified columns
         :obj:`cols`.
         """
-        cols = [cols] if isinstance(cols, str) else cols
+        cols = [cols] if isinstance(cols, str) else list(cols)
 
         if self.target_col is not None and self.target_col not in cols:
             cols.append(self.target_col)
 
         dataset = copy.copy(self)
-
-        dataset.df = self.df[cols]
+        # Invalidate the cached feature columns copied over from `self`:
+        dataset.__dict__.pop('_feat_cols', None)
+
+        # Assemble the data frame from the selected columns without copying
+        # them (as `self.df[cols]` would do):
+        dataset.df = pd.DataFrame(
+            {col: self.df[col]
+             for col in cols},
+            index=self.df.index,
+            copy=False,
+        )
         dataset.col_to_stype = {col: self.col_to_stype[col] for col in cols}
 
         return dataset
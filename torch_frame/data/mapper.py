@@ -26,6 +26,10 @@ NUM_HOURS_PER_DAY = 24
 NUM_MINUTES_PER_HOUR = 60
 NUM_SECONDS_PER_MINUTE = 60
 
+# Categorical columns whose categories are all non-negative integers below
+# this bound get mapped via a dense lookup table:
+LUT_MAX_CATEGORY = 2**20
+
 
 def _get_default_numpy_dtype() -> np.dtype:
     r"""Returns the default numpy dtype."""
@@ -36,6 +40,27 @@ def _get_default_numpy_dtype() -> np.dtype:
     return np.dtype(dtype)
 
 
+def _copy_from_numpy_(out: Tensor, arr: np.ndarray) -> Tensor:
+    r"""Copies a NumPy array into :obj:`out` in-place, casting its dtype on
+    the fly.
+    """
+    if out.device.type == 'cpu':
+        # NOTE: Unlike `torch.from_numpy`, this also supports read-only arrays
+        # such as `pd.Categorical.codes` without a warning.
+        np.copyto(out.numpy(), arr, casting='unsafe')
+        return out
+    return out.copy_(torch.from_numpy(arr))
+
+
+def _to_device(tensor: Tensor, device: torch.device | None) -> Tensor:
+    r"""Moves a CPU tensor to :obj:`device`. Transfers to CUDA are staged
+    through page-locked memory, which allows for faster, asynchronous copies.
+    """
+    if device is None or torch.device(device).type != 'cuda':
+        return tensor.to(device)
+    return tensor.pin_memory().to(device, non_blocking=True)
+
+
 class TensorMapper(ABC):
     r"""A base class to handle the conversion from raw input data into a
     compact tensor representation, i.e., the identity for numerical values,
@@ -63,15 +88,49 @@ class NumericalTensorMapper(TensorMapper):
     r"""Maps any numerical series into a floating-point representation, with
     :obj:`float('NaN')` denoting N/A values.
     """
+    @staticmethod
+    def to_numpy(ser: Series) -> np.ndarray:
+        r"""Returns the NumPy representation of a numerical series without
+        copying its data whenever possible. Nullable extension types and
+        :obj:`object` series are converted into :obj:`float64` with
+        :obj:`float('NaN')` denoting N/A values.
+        """
+        if isinstance(ser.dtype, np.dtype) and ser.dtype != object:
+            return ser.to_numpy()
+        return ser.to_numpy(dtype=np.float64, na_value=np.nan)
+
     def forward(
         self,
         ser: Series,
         *,
         device: torch.device | None = None,
+        values: np.ndarray | None = None,
+        out: Tensor | None = None,
     ) -> Tensor:
-        dtype = _get_default_numpy_dtype()
-        value = ser.values.astype(dtype)
-        return torch.from_numpy(value).to(device)
+        r"""Maps a numerical series into a floating-point tensor. On CPU, the
+        tensor shares its memory with :obj:`ser` in case :obj:`ser` already
+        holds values of the default floating-point type.
+
+        Args:
+            ser (Series): The numerical series.
+            device (torch.device, optional): The output device.
+                (default: :obj:`None`)
+            values (np.ndarray, optional): The pre-computed
+                :meth:`to_numpy` representation of :obj:`ser`, which will be
+                used instead of :obj:`ser` if given. (default: :obj:`None`)
+            out (Tensor, optional): If given, the result is written into this
+                one-dimensional tensor in-place and returned, which ignores
+                :obj:`device`. (default: :obj:`None`)
+        """
+        if values is None:
+            values = self.to_numpy(ser)
+        if out is not None:
+            return _copy_from_numpy_(out, values)
+        # Share memory with `values` if it already holds the default dtype:
+        value = values.astype(_get_default_numpy_dtype(), copy=False)
+        if not value.flags.writeable:
+            value = value.copy()
+        return _to_device(torch.from_numpy(value), device)
 
     def backward(self, tensor: Tensor) -> pd.Series:
         return pd.Series(tensor.detach().cpu().numpy())
@@ -89,25 +148,92 @@ class CategoricalTensorMapper(TensorMapper):
             name='index',
         )
 
+        # Small non-negative integer categories are looked up in a dense
+        # table, holding the index of each category and -1 otherwise:
+        self._lut: np.ndarray | None = None
+        values = np.asarray(self.categories.index)
+        if (len(values) > 0 and values.dtype.kind in 'iuf'
+                and values.min() >= 0 and values.max() < LUT_MAX_CATEGORY
+                and np.all(values == np.floor(values))):
+            self._lut = np.full(int(values.max()) + 2, -1, dtype=np.int32)
+            self._lut[values.astype(np.int64)] = np.arange(len(values))
+
+    def _lookup(self, values: np.ndarray) -> np.ndarray:
+        r"""Maps numerical values into category indices via the dense lookup
+        table, with :obj:`-1` denoting N/A values and unseen categories.
+        """
+        # The last entry of the table is reserved for invalid values:
+        num_entries = len(self._lut) - 1
+        valid = (values >= 0) & (values < num_entries)
+        if values.dtype.kind == 'f':  # Only integral values can be known:
+            valid &= values == np.floor(values)
+        index = np.where(valid, values, num_entries).astype(np.int64)
+        return self._lut[index]
+
+    @staticmethod
+    def index_dtype(num_categories: int) -> torch.dtype:
+        r"""Returns the narrowest integer type that can hold the indices of
+        :obj:`num_categories` categories, and :obj:`-1` for N/A values.
+        """
+        for dtype in (torch.int8, torch.int16, torch.int32):
+            if num_categories <= torch.iinfo(dtype).max:
+                return dtype
+        return torch.long
+
     def forward(
         self,
         ser: Series,
         *,
         device: torch.device | None = None,
+        values: np.ndarray | None = None,
+        out: Tensor | None = None,
+        dtype: torch.dtype = torch.long,
     ) -> Tensor:
-        index = pd.merge(
-            ser.rename('data'),
-            self.categories,
-            how='left',
-            left_on='data',
-            right_index=True,
-        )['index'].values
-        index = torch.from_numpy(index).to(device)
-
-        if index.is_floating_point():
-            index[index.isnan()] = -1
-
-        return index.to(torch.long)
+        r"""Maps a categorical series into an index tensor.
+
+        Args:
+            ser (Series): The categorical series.
+            device (torch.device, optional): The output device.
+                (default: :obj:`None`)
+            values (np.ndarray, optional): The pre-computed NumPy
+                representation of :obj:`ser`, which will be used instead of
+                :obj:`ser` if given. A two-dimensional array holds the values
+                of several columns sharing the same categories, which are
+                then mapped at once into an output of the same shape.
+                (default: :obj:`None`)
+            out (Tensor, optional): If given, the result is written into this
+                tensor in-place and returned, which ignores :obj:`device` and
+                :obj:`dtype`. (default: :obj:`None`)
+            dtype (torch.dtype, optional): The integer type of the output,
+                see :meth:`index_dtype` for the narrowest type that can hold
+                all indices. (default: :obj:`torch.long`)
+        """
+        shape = None
+        if values is not None and values.ndim > 1:
+            shape, values = values.shape, values.ravel()
+
+        categories = self.categories.index
+        if values is None and isinstance(ser.dtype, pd.CategoricalDtype):
+            if ser.cat.categories.equals(categories):
+                codes = ser.cat.codes.values
+            else:
+                codes = pd.Categorical(ser, categories=categories).codes
+        else:
+            if values is None:
+                values = ser.to_numpy()
+            if self._lut is not None and values.dtype.kind in 'iuf':
+                codes = self._lookup(values)
+            else:
+                # Let pandas factorize the values against the known
+                # categories, which readily assigns -1 to N/A values and
+                # unseen categories:
+                codes = pd.Categorical(values, categories=categories).codes
+        if shape is not None:
+            codes = codes.reshape(shape)
+        if out is not None:
+            return _copy_from_numpy_(out, codes)
+        out = torch.empty(codes.shape, dtype=dtype)
+        return _to_device(_copy_from_numpy_(out, codes), device)
 
     def backward(self, tensor: Tensor) -> pd.Series:
         index = tensor.cpu().numpy()
@@ -267,28 +393,45 @@ class TimestampTensorMapper(TensorMapper):
         self.format = format
 
     @staticmethod
-    def to_tensor(ser: Series) -> Tensor:
+    def to_tensor(ser: Series, out: Tensor | None = None) -> Tensor:
         # subtracting 1 so that the smallest months and days can
         # start from 0.
-        tensors = [
-            torch.from_numpy(ser.dt.year.values).unsqueeze(1),
-            torch.from_numpy(ser.dt.month.values - 1).unsqueeze(1),
-            torch.from_numpy(ser.dt.day.values - 1).unsqueeze(1),
-            torch.from_numpy(ser.dt.dayofweek.values).unsqueeze(1),
-            torch.from_numpy(ser.dt.hour.values).unsqueeze(1),
-            torch.from_numpy(ser.dt.minute.values).unsqueeze(1),
-            torch.from_numpy(ser.dt.second.values).unsqueeze(1)
+        values = [
+            ser.dt.year.values,
+            ser.dt.month.values - 1,
+            ser.dt.day.values - 1,
+            ser.dt.dayofweek.values,
+            ser.dt.hour.values,
+            ser.dt.minute.values,
+            ser.dt.second.values,
         ]
-        stacked = torch.cat(tensors, dim=1)
-        return torch.nan_to_num(stacked, nan=-1).to(torch.long)
+        if out is None:
+            out = torch.empty((len(ser), len(values)), dtype=torch.long)
+        for i, value in enumerate(values):
+            _copy_from_numpy_(out[:, i], np.nan_to_num(value, nan=-1))
+        return out
 
     def forward(
         self,
         ser: Series,
         *,
         device: torch.device | None = None,
+        out: Tensor | None = None,
     ) -> Tensor:
+        r"""Maps a timestamp series into a tensor of shape
+        :obj:`[num_rows, 7]`.
+
+        Args:
+            ser (Series): The timestamp series.
+            device (torch.device, optional): The output device.
+                (default: :obj:`None`)
+            out (Tensor, optional): If given, the result is written into this
+                :obj:`torch.long` tensor in-place and returned, which ignores
+                :obj:`device`. (default: :obj:`None`)
+        """
         ser = pd.to_datetime(ser, format=self.format, errors='coerce')
+        if out is not None:
+            return TimestampTensorMapper.to_tensor(ser, out)
         tensor = TimestampTensorMapper.to_tensor(ser)
         return tensor.to(device)
 
@@ -11,6 +11,7 @@ import torch
 import torch_frame
 from torch_frame.data.mapper import (
     MultiCategoricalTensorMapper,
+    NumericalTensorMapper,
     TimestampTensorMapper,
 )
 from torch_frame.typing import Series
@@ -83,29 +84,30 @@ class StatType(Enum):
         self,
         ser: Series,
         sep: str | None = None,
+        values: np.ndarray | None = None,
     ) -> Any:
+        if self in {StatType.MEAN, StatType.STD, StatType.QUANTILES}:
+            # `values` holds the pre-computed finite values of `ser`, such
+            # that they can be shared across all numerical statistics:
+            if values is None:
+                values = _finite_values(ser)
+
         if self == StatType.MEAN:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
+            if len(values) == 0:
                 # NOTE: We may just error out here if eveything is NaN
                 return np.nan
-            return np.mean(flattened[finite_mask]).item()
+            return np.mean(values).item()
 
         elif self == StatType.STD:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
+            if len(values) == 0:
                 return np.nan
-            return np.std(flattened[finite_mask]).item()
+            return np.std(values).item()
 
         elif self == StatType.QUANTILES:
-            flattened = np.hstack(np.hstack(ser.values))
-            finite_mask = np.isfinite(flattened)
-            if not finite_mask.any():
+            if len(values) == 0:
                 return [np.nan, np.nan, np.nan, np.nan, np.nan]
             return np.quantile(
-                flattened[finite_mask],
+                values,
                 q=[0, 0.25, 0.5, 0.75, 1],
             ).tolist()
 
@@ -140,6 +142,14 @@ class StatType(Enum):
             return len(ser[0])
 
 
+def _finite_values(ser: Series) -> np.ndarray:
+    r"""Flattens a numerical or sequence numerical series into a
+    one-dimensional array of its finite values.
+    """
+    flattened = np.hstack(np.hstack(ser.values))
+    return flattened[np.isfinite(flattened)]
+
+
 _default_values = {
     StatType.MEAN: np.nan,
     StatType.STD: np.nan,
@@ -159,13 +169,37 @@ def compute_col_stats(
     stype: torch_frame.stype,
     sep: str | None = None,
     time_format: str | None = None,
+    values: np.ndarray | None = None,
 ) -> dict[StatType, Any]:
     if stype == torch_frame.numerical:
-        ser = ser.mask(ser.isin([np.inf, -np.inf]), np.nan)
-        if not ptypes.is_numeric_dtype(ser):
-            raise TypeError("Numerical series contains invalid entries. "
-                            "Please make sure your numerical series "
-                            "contains only numerical values or nans.")
+        # `values` can hold the pre-computed NumPy representation of `ser`
+        # (see `NumericalTensorMapper.to_numpy`) to avoid converting it twice
+        # during materialization.
+        if values is None:
+            if not ptypes.is_numeric_dtype(ser):
+                raise TypeError("Numerical series contains invalid entries. "
+                                "Please make sure your numerical series "
+                                "contains only numerical values or nans.")
+            values = NumericalTensorMapper.to_numpy(ser)
+        values = values[np.isfinite(values)]
+        return {
+            stat_type: stat_type.compute(ser, sep, values=values)
+            for stat_type in StatType.stats_for_stype(stype)
+        }
+
+    if (stype == torch_frame.categorical
+            and isinstance(ser.dtype, pd.CategoricalDtype)):
+        # Count the existing category codes, which avoids both dropping N/A
+        # values and re-factorizing the series:
+        codes = ser.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return {StatType.COUNT: _default_values[StatType.COUNT]}
+        count = np.bincount(codes, minlength=len(ser.cat.categories))
+        count = pd.Series(count, index=ser.cat.categories)
+        count = count.sort_values(ascending=False)
+        return {StatType.COUNT: (count.index.tolist(), count.values.tolist())}
+
     if ser.isnull().all():
         # NOTE: We may just error out here if eveything is NaN
         stats = {
@@ -176,8 +210,11 @@ def compute_col_stats(
         if stype == torch_frame.timestamp:
             ser = pd.to_datetime(ser, format=time_format)
             ser = ser.sort_values()
+        ser = ser.dropna()
+        if stype == torch_frame.sequence_numerical:
+            values = _finite_values(ser)
         stats = {
-            stat_type: stat_type.compute(ser.dropna(), sep)
+            stat_type: stat_type.compute(ser, sep, values=values)
             for stat_type in StatType.stats_for_stype(stype)
         }
 
@@ -305,7 +305,8 @@ class EmbeddingEncoder(StypeEncoder):
         na_mask = feat < 0
         # Increment the index by one not to conflict with the padding idx
         # Also add offset for each column to avoid embedding conflict
-        feat = feat + self.offset + 1
+        # Indices may be stored in a narrower integer type than `torch.long`
+        feat = feat.to(torch.long) + self.offset + 1
         # Use 0th index for NaN
         feat[na_mask] = 0
         # [batch_size, num_cols, channels]
@@ -828,6 +829,10 @@ class LinearModelEncoder(StypeEncoder):
                 })
             else:
                 input_feat = feat[:, i]
+                if self.stype == stype.categorical:
+                    # Category indices may be stored in a narrower integer
+                    # type than `torch.long`:
+                    input_feat = input_feat.to(torch.long)
 
                 if input_feat.ndim == 1:
                     # Numerical and categorical cases:
@@ -81,7 +81,7 @@ class CatToNumTransform(FittableBaseTransform):
             col_name = tf_train.col_names_dict[stype.categorical][i]
             count = torch.tensor(col_stats[col_name][StatType.COUNT][1],
                                  device=tf_train.device)
-            feat = tensor[:, i]
+            feat = tensor[:, i].to(torch.long)
             v = torch.index_select(count, 0, feat).unsqueeze(1).repeat(
                 1, self.num_classes - 1)
             start = i * (self.num_classes - 1)
@@ -136,7 +136,7 @@ class CatToNumTransform(FittableBaseTransform):
                 self.col_stats[col_name][StatType.COUNT][1],
                 device=tf.device,
             )
-            feat = tensor[:, i]
+            feat = tensor[:, i].to(torch.long)
             max_cat = feat.max()
             if max_cat >= len(count):
                 raise RuntimeError(
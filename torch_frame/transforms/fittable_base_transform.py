@@ -42,26 +42,23 @@ class FittableBaseTransform(BaseTransform):
             Tensor: Output :class:`Tensor` with NaN values
                 replaced.
         """
-        x = x.clone()
-        for col in range(x.size(1)):
-            column_data = x[:, col]
-            if na_strategy.is_numerical_strategy:
-                nan_mask = torch.isnan(column_data)
-            else:
-                nan_mask = column_data < 0
-            if nan_mask.all():
-                raise ValueError("Column contains only nan values.")
-            if not nan_mask.any():
-                continue
-            valid_data = column_data[~nan_mask]
-            if na_strategy == NAStrategy.MEAN:
-                fill_value = valid_data.mean()
-            elif na_strategy in [NAStrategy.ZEROS, NAStrategy.MOST_FREQUENT]:
-                fill_value = torch.tensor(0.)
-            else:
-                raise ValueError(f'{na_strategy} is not supported.')
-            column_data[nan_mask] = fill_value
-        return x
+        # Operate on all columns at once, such that replacing NaNs takes a
+        # constant number of kernels on the device of `x`:
+        if na_strategy.is_numerical_strategy:
+            nan_mask = torch.isnan(x)
+        else:
+            nan_mask = x < 0
+        if nan_mask.all(dim=0).any():
+            raise ValueError("Column contains only nan values.")
+        if not nan_mask.any():
+            return x.clone()
+        if na_strategy == NAStrategy.MEAN:
+            fill_value = torch.nanmean(x, dim=0).expand_as(x)
+            return torch.where(nan_mask, fill_value, x)
+        elif na_strategy in [NAStrategy.ZEROS, NAStrategy.MOST_FREQUENT]:
+            return x.masked_fill(nan_mask, 0)
+        else:
+            raise ValueError(f'{na_strategy} is not supported.')
 
     def fit(
         self,